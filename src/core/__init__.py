@@ -2,6 +2,7 @@
 
 from .processor import ContentProcessor, ProcessedDocument, TOCGenerator
 from .analyzer import FileAnalyzer, FileInfo
+from .cache import FileCache
 from .merger import MergeEngine, MergeProgress, MergeResult, MergeStatus
 
 __all__ = [
@@ -10,6 +11,7 @@ __all__ = [
     'TOCGenerator',
     'FileAnalyzer',
     'FileInfo',
+    'FileCache',
     'MergeEngine',
     'MergeProgress',
     'MergeResult',
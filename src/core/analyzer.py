@@ -4,7 +4,13 @@ Handles file discovery, filtering, and analysis.
 """
 
 import os
+import re
+import stat as stat_module
+import threading
+from fnmatch import translate
+from operator import attrgetter
 from pathlib import Path
+from queue import Queue
 from typing import List, Dict, Optional, Tuple, Callable
 from dataclasses import dataclass
 from datetime import datetime
@@ -12,13 +18,57 @@ from datetime import datetime
 from ..utils.config import MergeConfig
 from ..utils.helpers import (
     natural_sort_key,
-    matches_patterns,
     calculate_file_hash,
     format_file_size,
+    hash_files_parallel,
 )
+from .cache import FileCache
 
 
-@dataclass
+# Pattern that is a plain filename-suffix glob, e.g. "*.md"
+_SUFFIX_GLOB_RE = re.compile(r'\*\.[a-z0-9]+$')
+
+
+class _CompiledPatterns:
+    """Glob patterns split into fast paths plus a regex fallback.
+
+    Most real patterns are fixed suffixes ("*.md") or literal names;
+    those are matched with str.endswith / a set lookup, and only true
+    globs fall through to the compiled alternation regex.
+    """
+
+    __slots__ = ('suffixes', 'exacts', 'regex')
+
+    def __init__(self, patterns: List[str]):
+        suffixes: List[str] = []
+        exacts: List[str] = []
+        globs: List[str] = []
+
+        for pattern in patterns:
+            pattern = pattern.lower()
+            if _SUFFIX_GLOB_RE.fullmatch(pattern):
+                suffixes.append(pattern[1:])
+            elif not any(ch in pattern for ch in '*?['):
+                exacts.append(pattern)
+            else:
+                globs.append(pattern)
+
+        self.suffixes = tuple(suffixes)
+        self.exacts = frozenset(exacts)
+        self.regex = (
+            re.compile("|".join(translate(p) for p in globs)) if globs else None
+        )
+
+    def match(self, filename: str) -> bool:
+        """Check a lowercased filename against the patterns."""
+        if filename.endswith(self.suffixes):
+            return True
+        if filename in self.exacts:
+            return True
+        return self.regex is not None and bool(self.regex.match(filename))
+
+
+@dataclass(slots=True)
 class FileInfo:
     """Information about a markdown file."""
     path: Path
@@ -26,6 +76,10 @@ class FileInfo:
     modified: datetime
     hash: Optional[str] = None
     preview: str = ""
+    # Display strings never change for a given file, so they are built
+    # once at creation instead of being re-formatted per list rebuild
+    display_text: str = ""
+    tooltip_text: str = ""
     
     @property
     def size_formatted(self) -> str:
@@ -41,7 +95,17 @@ class FileAnalyzer:
     
     def __init__(self, config: MergeConfig):
         self.config = config
-    
+        # Compile the glob patterns once; _matches_filters runs per file
+        # and repeated fnmatch calls would re-translate every pattern.
+        self._include = (
+            _CompiledPatterns(config.include_patterns)
+            if config.include_patterns else None
+        )
+        self._exclude = (
+            _CompiledPatterns(config.exclude_patterns)
+            if config.exclude_patterns else None
+        )
+
     def discover_files(
         self,
         paths: List[Path],
@@ -58,18 +122,33 @@ class FileAnalyzer:
             List of FileInfo objects
         """
         files = []
-        
+
         for path in paths:
-            if path.is_file():
-                if self._matches_filters(path):
-                    files.append(self._analyze_file(path))
+            # Stat once and branch on the mode rather than paying a
+            # syscall each for is_file, is_dir, and make_file_info.
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            if stat_module.S_ISREG(stat.st_mode):
+                if self._matches_filters(path.name):
+                    files.append(self.make_file_info(path, stat))
                     if progress_callback:
                         progress_callback(f"Found: {path.name}")
-            elif path.is_dir():
+            elif stat_module.S_ISDIR(stat.st_mode):
                 files.extend(self._scan_directory(path, progress_callback))
-        
+
         return self._sort_files(files)
-    
+
+    # Traversal is I/O-bound, so subdirectory scans can overlap; cap the
+    # pool well below typical ulimits since each worker holds a dir handle.
+    _SCAN_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+    # Below this many subdirectories the thread startup cost outweighs the
+    # overlap, so small trees are scanned recursively on the calling thread.
+    _PARALLEL_THRESHOLD = 4
+
     def _scan_directory(
         self,
         directory: Path,
@@ -77,81 +156,179 @@ class FileAnalyzer:
         current_depth: int = 0
     ) -> List[FileInfo]:
         """Recursively scan a directory for markdown files."""
-        files = []
-        
+        files, subdirs = self._scan_single(directory, current_depth, progress_callback)
+
+        if not subdirs:
+            return files
+
+        if len(subdirs) <= self._PARALLEL_THRESHOLD:
+            for subdir, depth in subdirs:
+                files.extend(self._scan_directory(subdir, progress_callback, depth))
+            return files
+
+        # Drain the remaining tree with a worker pool sharing a queue of
+        # pending directories. Results are appended under a lock; order
+        # doesn't matter because discover_files sorts afterwards.
+        pending: Queue = Queue()
+        for item in subdirs:
+            pending.put(item)
+
+        lock = threading.Lock()
+
+        def worker():
+            while True:
+                item = pending.get()
+                if item is None:
+                    pending.task_done()
+                    return
+                subdir, depth = item
+                try:
+                    found, nested = self._scan_single(subdir, depth, progress_callback, lock)
+                    with lock:
+                        files.extend(found)
+                    for entry in nested:
+                        pending.put(entry)
+                finally:
+                    pending.task_done()
+
+        workers = min(self._SCAN_WORKERS, len(subdirs))
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+
+        pending.join()
+        for _ in threads:
+            pending.put(None)
+        for thread in threads:
+            thread.join()
+
+        return files
+
+    def _scan_single(
+        self,
+        directory: Path,
+        current_depth: int,
+        progress_callback: Optional[Callable[[str], None]] = None,
+        lock: Optional[threading.Lock] = None
+    ) -> Tuple[List[FileInfo], List[Tuple[Path, int]]]:
+        """Scan one directory, returning its files and child directories."""
+        files: List[FileInfo] = []
+        subdirs: List[Tuple[Path, int]] = []
+
         # Check depth limit
         if self.config.max_depth >= 0 and current_depth > self.config.max_depth:
-            return files
-        
+            return files, subdirs
+
         try:
-            for entry in directory.iterdir():
-                if entry.is_file() and self._matches_filters(entry):
-                    files.append(self._analyze_file(entry))
-                    if progress_callback:
-                        progress_callback(f"Found: {entry.name}")
-                        
-                elif entry.is_dir() and self.config.recursive:
-                    # Skip hidden directories
-                    if not entry.name.startswith('.'):
-                        files.extend(self._scan_directory(
-                            entry, progress_callback, current_depth + 1
-                        ))
+            # os.scandir exposes the file type and stat data returned by the
+            # directory read itself, so we avoid a separate stat syscall per
+            # entry (and a second one inside make_file_info).
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        if self._matches_filters(entry.name):
+                            files.append(self.make_file_info(
+                                Path(entry.path), entry.stat()
+                            ))
+                            if progress_callback:
+                                self._report(progress_callback,
+                                             f"Found: {entry.name}", lock)
+
+                    elif entry.is_dir(follow_symlinks=False) and self.config.recursive:
+                        # Skip hidden directories
+                        if not entry.name.startswith('.'):
+                            subdirs.append((Path(entry.path), current_depth + 1))
         except PermissionError:
             if progress_callback:
-                progress_callback(f"⚠ Permission denied: {directory}")
-        
-        return files
-    
-    def _matches_filters(self, filepath: Path) -> bool:
-        """Check if file matches include/exclude patterns."""
-        filename = filepath.name
-        
+                self._report(progress_callback,
+                             f"⚠ Permission denied: {directory}", lock)
+        except OSError as e:
+            # Directories vanishing or entries failing to stat mid-scan
+            # must not escape: in the parallel drain an escaped error
+            # kills the worker thread and can hang the queue join
+            if progress_callback:
+                self._report(progress_callback,
+                             f"⚠ Could not scan {directory}: {e}", lock)
+
+        return files, subdirs
+
+    @staticmethod
+    def _report(
+        progress_callback: Callable[[str], None],
+        message: str,
+        lock: Optional[threading.Lock]
+    ) -> None:
+        """Invoke the progress callback, serialized when scanning in parallel."""
+        if lock is not None:
+            with lock:
+                progress_callback(message)
+        else:
+            progress_callback(message)
+
+    def _matches_filters(self, filename: str) -> bool:
+        """Check if filename matches include/exclude patterns."""
+        filename = filename.lower()
+
         # Check include patterns
-        if not matches_patterns(filename, self.config.include_patterns):
+        if self._include is None or not self._include.match(filename):
             return False
-        
+
         # Check exclude patterns
-        if self.config.exclude_patterns:
-            if matches_patterns(filename, self.config.exclude_patterns):
-                return False
-        
+        if self._exclude is not None and self._exclude.match(filename):
+            return False
+
         return True
-    
-    def _analyze_file(self, filepath: Path) -> FileInfo:
+
+    # Upper bound on bytes read for a file preview; 8 KiB comfortably
+    # covers the 500 characters shown while keeping reads to one syscall.
+    _PREVIEW_BYTES = 8192
+
+    def make_file_info(
+        self,
+        filepath: Path,
+        stat: Optional[os.stat_result] = None
+    ) -> FileInfo:
         """Analyze a single file and return FileInfo."""
-        stat = filepath.stat()
-        
-        # Read preview (first few lines)
+        if stat is None:
+            stat = filepath.stat()
+
+        # Read preview (first few lines) as one capped binary read and a
+        # single decode, instead of text-mode incremental decoding
         preview = ""
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                preview = f.read(500)
-                if len(preview) == 500:
-                    preview = preview.rsplit('\n', 1)[0] + '...'
+            with open(filepath, 'rb') as f:
+                data = f.read(self._PREVIEW_BYTES)
+            preview = data.decode('utf-8', errors='replace')
+            if len(preview) > 500:
+                preview = preview[:500].rsplit('\n', 1)[0] + '...'
         except IOError:
             preview = "[Could not read file]"
         
+        size = stat.st_size
         return FileInfo(
             path=filepath,
-            size=stat.st_size,
+            size=size,
             modified=datetime.fromtimestamp(stat.st_mtime),
             preview=preview,
+            display_text=f"{filepath.name}  ({format_file_size(size)})",
+            tooltip_text=str(filepath),
         )
     
     def _sort_files(self, files: List[FileInfo]) -> List[FileInfo]:
         """Sort files according to configuration."""
         reverse = not self.config.sort_ascending
-        
+
         if self.config.sort_order == "alphabetical":
             files.sort(key=lambda f: str(f.path).lower(), reverse=reverse)
         elif self.config.sort_order == "natural":
             files.sort(key=lambda f: natural_sort_key(str(f.path)), reverse=reverse)
         elif self.config.sort_order == "date":
-            files.sort(key=lambda f: f.modified, reverse=reverse)
+            # attrgetter keys skip the per-element Python frame a lambda costs
+            files.sort(key=attrgetter('modified'), reverse=reverse)
         elif self.config.sort_order == "size":
-            files.sort(key=lambda f: f.size, reverse=reverse)
+            files.sort(key=attrgetter('size'), reverse=reverse)
         # "custom" order is preserved as-is
-        
+
         return files
     
     def detect_duplicates(
@@ -167,20 +344,62 @@ class FileAnalyzer:
         """
         if not self.config.detect_duplicates:
             return {}
-        
-        hash_map: Dict[str, List[FileInfo]] = {}
-        
+
+        # Files can only be duplicates if their sizes match, so bucket by
+        # size first and only hash files whose size is shared. On typical
+        # corpora this skips reading the large majority of files.
+        by_size: Dict[int, List[FileInfo]] = {}
         for file_info in files:
-            if progress_callback:
-                progress_callback(f"Checking: {file_info.path.name}")
-            
-            file_hash = calculate_file_hash(file_info.path)
-            file_info.hash = file_hash
-            
-            if file_hash not in hash_map:
-                hash_map[file_hash] = []
-            hash_map[file_hash].append(file_info)
-        
+            by_size.setdefault(file_info.size, []).append(file_info)
+
+        hash_map: Dict[str, List[FileInfo]] = {}
+
+        # The persistent cache resolves files whose (mtime, size) are
+        # unchanged since a previous run without rereading their content.
+        cache = FileCache()
+        candidates: List[FileInfo] = []
+        for bucket in by_size.values():
+            if len(bucket) <= 1:
+                continue
+            for file_info in bucket:
+                cached = cache.get(
+                    file_info.path, file_info.modified.timestamp(), file_info.size
+                )
+                if cached is not None:
+                    file_info.hash = cached
+                    hash_map.setdefault(cached, []).append(file_info)
+                else:
+                    candidates.append(file_info)
+
+        # Hashing is dominated by file reads and the hash core's C loop,
+        # both of which release the GIL, so the shared thread-pool helper
+        # overlaps the per-file I/O. Small batches stay sequential to
+        # avoid pool startup cost.
+        if len(candidates) >= self._PARALLEL_THRESHOLD:
+            hashes = hash_files_parallel(
+                [f.path for f in candidates], workers=self._SCAN_WORKERS
+            )
+            for file_info, file_hash in zip(candidates, hashes):
+                if progress_callback:
+                    progress_callback(f"Checking: {file_info.path.name}")
+                file_info.hash = file_hash
+                hash_map.setdefault(file_hash, []).append(file_info)
+        else:
+            for file_info in candidates:
+                if progress_callback:
+                    progress_callback(f"Checking: {file_info.path.name}")
+
+                file_hash = calculate_file_hash(file_info.path)
+                file_info.hash = file_hash
+                hash_map.setdefault(file_hash, []).append(file_info)
+
+        for file_info in candidates:
+            cache.put(
+                file_info.path, file_info.modified.timestamp(),
+                file_info.size, file_info.hash
+            )
+        cache.save()
+
         # Return only duplicates (more than one file with same hash)
         return {h: files for h, files in hash_map.items() if len(files) > 1}
     
@@ -197,15 +416,25 @@ class FileAnalyzer:
                 "newest": None,
             }
         
-        total_size = sum(f.size for f in files)
+        # Aggregate size and modification-time extremes in one pass
+        # instead of three separate traversals
+        total_size = 0
+        oldest = newest = files[0].modified
+        for f in files:
+            total_size += f.size
+            if f.modified < oldest:
+                oldest = f.modified
+            elif f.modified > newest:
+                newest = f.modified
+
         avg_size = total_size // len(files)
-        
+
         return {
             "count": len(files),
             "total_size": total_size,
             "total_size_formatted": format_file_size(total_size),
             "avg_size": avg_size,
             "avg_size_formatted": format_file_size(avg_size),
-            "oldest": min(f.modified for f in files),
-            "newest": max(f.modified for f in files),
+            "oldest": oldest,
+            "newest": newest,
         }
@@ -0,0 +1,68 @@
+"""
+File hash cache for Markdown Merger.
+Avoids re-hashing files that have not changed between runs.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ..utils.config import AppConfig
+
+
+class FileCache:
+    """
+    Persistent cache of file content hashes.
+
+    Entries are keyed by (path, mtime, size), so a file is only
+    re-hashed after it actually changes. The cache is stored as JSON
+    in the application config directory alongside app_config.json.
+    """
+
+    _FILENAME = 'hash_cache.json'
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        if cache_path is None:
+            cache_path = AppConfig.get_config_dir() / self._FILENAME
+        self.cache_path = cache_path
+        self._entries: Dict[str, Tuple[float, int, str]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load cached entries from disk, ignoring a missing or bad file."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._entries = {
+                path: (entry[0], entry[1], entry[2])
+                for path, entry in data.items()
+            }
+        # AttributeError covers valid JSON that isn't an object
+        # (e.g. a file containing just a list)
+        except (FileNotFoundError, json.JSONDecodeError, IOError,
+                IndexError, TypeError, AttributeError):
+            self._entries = {}
+
+    def get(self, path: Path, mtime: float, size: int) -> Optional[str]:
+        """Return the cached hash if the file is unchanged, else None."""
+        entry = self._entries.get(str(path))
+        if entry is not None and entry[0] == mtime and entry[1] == size:
+            return entry[2]
+        return None
+
+    def put(self, path: Path, mtime: float, size: int, file_hash: str) -> None:
+        """Record the hash for the file's current (mtime, size)."""
+        self._entries[str(path)] = (mtime, size, file_hash)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist entries to disk if anything changed since loading."""
+        if not self._dirty:
+            return
+        try:
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            self._dirty = False
+        except IOError:
+            pass
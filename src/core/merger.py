@@ -5,6 +5,10 @@ Handles the complete merge workflow with streaming support.
 
 import os
 import shutil
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Callable, Generator
 from dataclasses import dataclass
@@ -12,7 +16,7 @@ from datetime import datetime
 from enum import Enum
 
 from ..utils.config import MergeConfig
-from ..utils.helpers import safe_read_file, normalize_line_endings
+from ..utils.helpers import safe_read_file, normalize_line_endings, head_lines
 from .processor import ContentProcessor, TOCGenerator, ProcessedDocument
 from .analyzer import FileInfo, FileAnalyzer
 
@@ -27,7 +31,7 @@ class MergeStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeProgress:
     """Progress information for merge operation."""
     status: MergeStatus
@@ -60,7 +64,7 @@ class MergeProgress:
         return remaining / self.files_per_second
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeResult:
     """Result of a merge operation."""
     success: bool
@@ -86,15 +90,28 @@ class MergeEngine:
     
     Handles file merging with streaming processing,
     progress tracking, and cancellation support.
+
+    Processing runs on the calling thread (file reads are prefetched on
+    a small thread pool); the engine deliberately does not fan work out
+    to worker processes, since it usually runs inside the GUI's worker
+    thread where forking is unsafe and pause/cancel need per-file
+    control.
     """
-    
+
+    # How many file reads to keep in flight ahead of processing.
+    _PREFETCH_DEPTH = 8
+
     def __init__(self, config: MergeConfig):
         self.config = config
         self.processor = ContentProcessor(config)
         self.toc_generator = TOCGenerator(config)
         self._cancelled = False
-        self._paused = False
-    
+        # Set while running, cleared while paused; the merge loop blocks
+        # on it instead of polling, so pausing costs no CPU and resuming
+        # takes effect immediately.
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+
     def merge(
         self,
         files: List[FileInfo],
@@ -115,29 +132,53 @@ class MergeEngine:
             MergeResult with operation details
         """
         self._cancelled = False
-        self._paused = False
-        
+        self._resume_event.set()
+
+        # Nothing to merge: report success without touching the disk,
+        # taking a backup, or spinning up the read pipeline
+        if not files:
+            return MergeResult(
+                success=True,
+                output_path=output_path if not dry_run else None,
+                files_merged=0,
+                total_size=0,
+                duration_seconds=0.0,
+                errors=[],
+                warnings=[],
+            )
+
         start_time = datetime.now()
+        start_monotonic = time.monotonic()
         errors: List[str] = []
         warnings: List[str] = []
         bytes_processed = 0
         total_bytes = sum(f.size for f in files)
-        
-        # Create progress tracker
+
+        # Create progress tracker. Building a MergeProgress (plus list
+        # copies) for every file is measurable on merges of thousands of
+        # small files, so updates are rate-limited; the final file always
+        # reports so the consumer sees 100%.
+        last_report = 0.0
+
         def update_progress(index: int, current_file: str):
-            if progress_callback:
-                elapsed = (datetime.now() - start_time).total_seconds()
-                progress_callback(MergeProgress(
-                    status=MergeStatus.RUNNING,
-                    current_file=current_file,
-                    current_index=index,
-                    total_files=len(files),
-                    bytes_processed=bytes_processed,
-                    total_bytes=total_bytes,
-                    elapsed_seconds=elapsed,
-                    errors=errors.copy(),
-                    warnings=warnings.copy(),
-                ))
+            nonlocal last_report
+            if not progress_callback:
+                return
+            now = time.monotonic()
+            if index < len(files) and now - last_report < 0.05:
+                return
+            last_report = now
+            progress_callback(MergeProgress(
+                status=MergeStatus.RUNNING,
+                current_file=current_file,
+                current_index=index,
+                total_files=len(files),
+                bytes_processed=bytes_processed,
+                total_bytes=total_bytes,
+                elapsed_seconds=now - start_monotonic,
+                errors=errors.copy(),
+                warnings=warnings.copy(),
+            ))
         
         # Backup existing file if configured
         if not dry_run and self.config.create_backup and output_path.exists():
@@ -150,43 +191,55 @@ class MergeEngine:
                 warnings.append(f"Could not create backup: {e}")
         
         try:
-            # Phase 1: Process all documents
+            # Phase 1: Process all documents. File reads are prefetched a
+            # few files ahead on a small thread pool so disk latency
+            # overlaps the regex-heavy processing on this thread.
             processed_docs: List[ProcessedDocument] = []
-            
-            for index, file_info in enumerate(files, 1):
-                # Check for cancellation
-                if self._cancelled:
-                    return MergeResult(
-                        success=False,
-                        output_path=None,
-                        files_merged=index - 1,
-                        total_size=bytes_processed,
-                        duration_seconds=(datetime.now() - start_time).total_seconds(),
-                        errors=["Merge cancelled by user"],
-                        warnings=warnings,
-                    )
-                
-                # Wait while paused
-                while self._paused:
-                    import time
-                    time.sleep(0.1)
+
+            with ThreadPoolExecutor(max_workers=4) as readers:
+                pending = deque(
+                    readers.submit(safe_read_file, f.path)
+                    for f in files[:self._PREFETCH_DEPTH]
+                )
+
+                for index, file_info in enumerate(files, 1):
+                    # Check for cancellation
                     if self._cancelled:
-                        break
-                
-                update_progress(index, file_info.path.name)
-                
-                try:
-                    content = safe_read_file(file_info.path)
-                    doc = self.processor.process_document(
-                        file_info.path, content, index, len(files)
-                    )
-                    processed_docs.append(doc)
-                    bytes_processed += file_info.size
-                    
-                except Exception as e:
-                    error_msg = f"Error processing {file_info.path.name}: {e}"
-                    errors.append(error_msg)
-                    # Continue with other files
+                        return MergeResult(
+                            success=False,
+                            output_path=None,
+                            files_merged=index - 1,
+                            total_size=bytes_processed,
+                            duration_seconds=(datetime.now() - start_time).total_seconds(),
+                            errors=["Merge cancelled by user"],
+                            warnings=warnings,
+                        )
+
+                    # Block while paused; cancel() sets the event too so a
+                    # paused merge wakes up and sees the cancellation.
+                    self._resume_event.wait()
+
+                    update_progress(index, file_info.path.name)
+
+                    # Keep the read pipeline topped up
+                    next_index = index + self._PREFETCH_DEPTH - 1
+                    if next_index < len(files):
+                        pending.append(readers.submit(
+                            safe_read_file, files[next_index].path
+                        ))
+
+                    try:
+                        content = pending.popleft().result()
+                        doc = self.processor.process_document(
+                            file_info.path, content, index, len(files)
+                        )
+                        processed_docs.append(doc)
+                        bytes_processed += file_info.size
+
+                    except Exception as e:
+                        error_msg = f"Error processing {file_info.path.name}: {e}"
+                        errors.append(error_msg)
+                        # Continue with other files
             
             # Phase 2: Generate output
             if not dry_run:
@@ -223,64 +276,75 @@ class MergeEngine:
         """Write merged output to file."""
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, 'w', encoding=self.config.output_encoding) as f:
+
+        # A 1 MiB buffer keeps the many small per-document writes from
+        # turning into individual write syscalls on large merges. Each
+        # fragment is encoded once and written as bytes; routing strings
+        # through a TextIOWrapper would add a second scan per write.
+        encoding = self.config.output_encoding
+        with open(output_path, 'wb', buffering=1 << 20) as f:
             # Write TOC if configured
             if self.config.generate_toc and self.config.toc_position == "top":
                 toc = self.toc_generator.generate(documents)
-                f.write(toc)
+                f.write(toc.encode(encoding))
             
-            # Write each document
+            # Write each document. The fragments are collected and joined
+            # so each document costs one write call instead of up to seven.
             for i, doc in enumerate(documents):
+                parts = []
+
                 # Metadata comment
                 metadata = self.processor.generate_metadata_comment(doc)
                 if metadata:
-                    f.write(metadata + '\n')
-                
+                    parts.append(metadata + '\n')
+
                 # Semantic start marker
                 start_marker = self.processor.generate_semantic_markers(doc, "start")
                 if start_marker:
-                    f.write(start_marker + '\n')
-                
+                    parts.append(start_marker + '\n')
+
                 # Chunk hint
                 chunk_hint = self.processor.generate_chunk_hint(doc)
                 if chunk_hint:
-                    f.write(chunk_hint + '\n')
-                
+                    parts.append(chunk_hint + '\n')
+
                 # Document header
                 header = self.processor.generate_document_header(doc)
-                f.write(header + '\n\n')
-                
+                parts.append(header + '\n\n')
+
                 # Document content
-                f.write(doc.processed_content)
-                
+                parts.append(doc.processed_content)
+
                 # Semantic end marker
                 end_marker = self.processor.generate_semantic_markers(doc, "end")
                 if end_marker:
-                    f.write('\n' + end_marker)
-                
+                    parts.append('\n' + end_marker)
+
                 # Add separator between documents (not after last one)
                 if i < len(documents) - 1:
-                    separator = self.processor.generate_separator()
-                    f.write(separator)
-            
+                    parts.append(self.processor.generate_separator())
+
+                f.write(''.join(parts).encode(encoding))
+
             # Write TOC at bottom if configured
             if self.config.generate_toc and self.config.toc_position == "bottom":
-                f.write('\n\n')
+                f.write(b'\n\n')
                 toc = self.toc_generator.generate(documents)
-                f.write(toc)
+                f.write(toc.encode(encoding))
     
     def cancel(self) -> None:
         """Cancel the current merge operation."""
         self._cancelled = True
-    
+        # Unblock a paused merge so it can observe the cancellation
+        self._resume_event.set()
+
     def pause(self) -> None:
         """Pause the current merge operation."""
-        self._paused = True
-    
+        self._resume_event.clear()
+
     def resume(self) -> None:
         """Resume a paused merge operation."""
-        self._paused = False
+        self._resume_event.set()
     
     def generate_preview(
         self,
@@ -328,9 +392,9 @@ class MergeEngine:
                 lines.append(header)
                 lines.append("")
                 
-                # Add content preview (first N lines)
-                content_lines = doc.processed_content.split('\n')[:20]
-                lines.extend(content_lines)
+                # Add content preview (first N lines) without splitting
+                # the whole document
+                lines.extend(head_lines(doc.processed_content, 20))
                 
                 if len(files) > len(preview_files) or i < len(preview_files):
                     separator = self.processor.generate_separator()
@@ -3,25 +3,34 @@ Content processor for Markdown Merger.
 Handles all content transformation operations.
 """
 
-import re
+import json
+import threading
+from collections import OrderedDict
 from typing import Optional, List, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
 
+# orjson serializes the small metadata dicts several times faster than
+# the stdlib; fall back to json when it isn't installed.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _dumps = json.dumps
+
 from ..utils.config import MergeConfig
 from ..utils.helpers import (
-    extract_front_matter,
-    adjust_header_levels,
-    normalize_whitespace,
-    normalize_line_endings,
-    extract_headers,
+    fused_transform,
     generate_anchor,
     extract_keywords,
+    is_pure_passthrough,
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedDocument:
     """Represents a processed markdown document."""
     source_path: Path
@@ -38,10 +47,20 @@ class ProcessedDocument:
 
 class ContentProcessor:
     """Processes markdown content according to configuration."""
-    
+
+    # Transform results keyed by (content, parse-affecting config key);
+    # repeat merges and previews over unchanged files skip the regex
+    # passes entirely. Note this pins up to the cap's worth of document
+    # texts in memory for the life of the process. The lock guards the
+    # get/move/put/evict sequences: merges and previews run on separate
+    # worker threads through this shared cache.
+    _transform_cache: OrderedDict = OrderedDict()
+    _transform_lock = threading.Lock()
+    _TRANSFORM_CACHE_MAX = 256
+
     def __init__(self, config: MergeConfig):
         self.config = config
-    
+
     def process_document(
         self,
         filepath: Path,
@@ -62,31 +81,47 @@ class ContentProcessor:
             ProcessedDocument with all transformations applied
         """
         original_content = content
-        front_matter = None
-        
-        # Step 1: Handle front matter
-        if self.config.strip_front_matter:
-            front_matter, content = extract_front_matter(content)
-        
-        # Step 2: Adjust header levels
-        if self.config.adjust_header_level != 0:
-            content = adjust_header_levels(content, self.config.adjust_header_level)
-        
-        # Step 3: Normalize whitespace
-        if self.config.normalize_whitespace:
-            content = normalize_whitespace(content, self.config.max_consecutive_blanks)
-        
-        # Step 4: Normalize line endings
-        content = normalize_line_endings(content, self.config.line_ending)
-        
-        # Extract headers for TOC
-        headers = extract_headers(content, self.config.toc_depth)
-        
-        # Extract keywords if enabled
-        keywords = []
-        if self.config.extract_keywords:
-            keywords = extract_keywords(content)
-        
+
+        cache = self._transform_cache
+        cache_key = (content, self.config.parse_cache_key())
+        with self._transform_lock:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                cache.move_to_end(cache_key)
+        if cached is not None:
+            content, headers, front_matter, keywords = cached
+        else:
+            if (is_pure_passthrough(self.config)
+                    and not self.config.generate_toc
+                    and '\r' not in content):
+                # No transformation, no TOC needing headers, and no CRLF
+                # to normalize: the content goes into the output verbatim
+                headers: List[Tuple[int, str]] = []
+                front_matter = None
+            else:
+                # Front-matter stripping, header adjustment, whitespace
+                # and line-ending normalization, and header extraction
+                # for the TOC all happen in one pass over the content
+                content, headers, front_matter = fused_transform(
+                    content,
+                    strip_front_matter=self.config.strip_front_matter,
+                    header_offset=self.config.adjust_header_level,
+                    normalize_blanks=self.config.normalize_whitespace,
+                    max_consecutive_blanks=self.config.max_consecutive_blanks,
+                    line_ending=self.config.line_ending,
+                    max_header_depth=self.config.toc_depth,
+                )
+
+            # Extract keywords if enabled
+            keywords = []
+            if self.config.extract_keywords:
+                keywords = extract_keywords(content)
+
+            with self._transform_lock:
+                cache[cache_key] = (content, headers, front_matter, keywords)
+                if len(cache) > self._TRANSFORM_CACHE_MAX:
+                    cache.popitem(last=False)
+
         # Get file metadata
         stat = filepath.stat()
         
@@ -135,8 +170,7 @@ class ContentProcessor:
         if doc.keywords:
             metadata["keywords"] = doc.keywords
         
-        import json
-        return f"<!-- DOC_META: {json.dumps(metadata)} -->"
+        return f"<!-- DOC_META: {_dumps(metadata)} -->"
     
     def generate_semantic_markers(
         self,
@@ -179,29 +213,37 @@ class TOCGenerator:
         """Generate table of contents for all documents."""
         if not self.config.generate_toc:
             return ""
-        
+
+        # Resolve the style and depth once rather than re-comparing config
+        # strings for every entry; indent strings are shared across entries,
+        # and header anchors are only built when the style needs them.
+        links = self.config.toc_style == "links"
+        numbered = self.config.toc_style == "numbered"
+        max_depth = self.config.toc_depth
+        indents = ["  " * level for level in range(6)]
+
         lines = ["# Table of Contents", ""]
-        
+
         for doc in documents:
             # Add document entry
             doc_name = doc.source_path.stem
             anchor = generate_anchor(doc_name)
-            
-            if self.config.toc_style == "links":
+
+            if links:
                 lines.append(f"- [{doc_name}](#{anchor})")
-            elif self.config.toc_style == "numbered":
+            elif numbered:
                 lines.append(f"{doc.index}. [{doc_name}](#{anchor})")
             else:  # plain
                 lines.append(f"- {doc_name}")
-            
+
             # Add headers within document if depth allows
-            if self.config.toc_depth > 1:
+            if max_depth > 1:
                 for level, header_text in doc.headers:
-                    if level <= self.config.toc_depth:
-                        indent = "  " * (level - 1)
-                        header_anchor = f"{anchor}--{generate_anchor(header_text)}"
-                        
-                        if self.config.toc_style == "links":
+                    if level <= max_depth:
+                        indent = indents[level - 1]
+
+                        if links:
+                            header_anchor = f"{anchor}--{generate_anchor(header_text)}"
                             lines.append(f"{indent}- [{header_text}](#{header_anchor})")
                         else:
                             lines.append(f"{indent}- {header_text}")
@@ -3,9 +3,11 @@ Main window for Markdown Merger application.
 """
 
 import sys
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -16,8 +18,13 @@ from PyQt6.QtWidgets import (
     QSpinBox, QDialog, QDialogButtonBox, QTabWidget,
     QFormLayout, QFrame, QSizePolicy, QApplication
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize, QMimeData, QUrl
-from PyQt6.QtGui import QAction, QIcon, QDragEnterEvent, QDropEvent, QFont
+from PyQt6.QtCore import (
+    Qt, QObject, QRunnable, QThread, QThreadPool, QTimer,
+    pyqtSignal, QSize, QMimeData, QUrl
+)
+from PyQt6.QtGui import (
+    QAction, QIcon, QDragEnterEvent, QDropEvent, QFont, QTextCursor
+)
 
 from ..core import (
     MergeEngine, FileAnalyzer, FileInfo,
@@ -26,13 +33,155 @@ from ..core import (
 from ..utils import MergeConfig, AppConfig, PRESETS, get_preset, format_file_size
 
 
-class MergeWorker(QThread):
-    """Background worker for merge operations."""
-    
+# Suffixes that identify a dropped path as a markdown file without
+# consulting the analyzer's include patterns
+_MARKDOWN_SUFFIXES = {'.md', '.markdown'}
+
+# Resolved once; the enum attribute chains otherwise re-run on every
+# checkbox signal and every item.data()/setData() call
+_CHECKED_VAL = Qt.CheckState.Checked.value
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
+@lru_cache(maxsize=None)
+def _mono_font(point_size: int) -> QFont:
+    """Shared monospace font, resolved once per size.
+
+    Each QFont construction goes through the font database; the lazy
+    cache also avoids creating fonts before the QApplication exists.
+    """
+    return QFont("Consolas", point_size)
+
+
+@lru_cache(maxsize=2)
+def _log_timestamp(second: int) -> str:
+    """HH:MM:SS for a whole second; log bursts reuse the same string."""
+    return time.strftime("%H:%M:%S", time.localtime(second))
+
+
+# Rendered previews keyed by (config snapshot, file identity list); a
+# repeat refresh over unchanged files skips rereading them entirely
+_preview_cache: OrderedDict = OrderedDict()
+_PREVIEW_CACHE_MAX = 64
+
+# Dark theme stylesheet, built once at import so apply_theme doesn't
+# reassemble the literal on every toggle
+_DARK_QSS = """
+    QMainWindow, QDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QGroupBox {
+        border: 1px solid #555555;
+        margin-top: 10px;
+        padding-top: 10px;
+        color: #ffffff;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QListWidget, QTextEdit, QLineEdit {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        border: 1px solid #555555;
+    }
+    QPushButton {
+        background-color: #3c3c3c;
+        color: #ffffff;
+        border: 1px solid #555555;
+        padding: 5px 15px;
+        border-radius: 3px;
+    }
+    QPushButton:hover {
+        background-color: #4a4a4a;
+    }
+    QPushButton:pressed {
+        background-color: #2a2a2a;
+    }
+    QComboBox {
+        background-color: #3c3c3c;
+        color: #ffffff;
+        border: 1px solid #555555;
+        padding: 3px;
+    }
+    QProgressBar {
+        border: 1px solid #555555;
+        background-color: #1e1e1e;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: #0078d4;
+    }
+    QMenuBar {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QMenuBar::item:selected {
+        background-color: #3c3c3c;
+    }
+    QMenu {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QMenu::item:selected {
+        background-color: #3c3c3c;
+    }
+"""
+
+
+def _scan_config_key(config: MergeConfig) -> Tuple:
+    """Hashable key of the config fields that affect file discovery."""
+    return (
+        tuple(config.include_patterns),
+        tuple(config.exclude_patterns),
+        config.recursive,
+        config.max_depth,
+        config.sort_order,
+        config.sort_ascending,
+    )
+
+
+@lru_cache(maxsize=256)
+def _scan_path(path_str: str, mtime_ns: int, cfg_key: Tuple) -> Tuple[FileInfo, ...]:
+    """
+    Discover files under a path, memoized on (path, mtime, scan config).
+
+    Re-dropping an unchanged folder is a cache hit and skips the whole
+    directory walk and preview reads; edits bump the mtime and miss
+    naturally. mtime_ns exists only to key the cache. Note that editing
+    a file deep in a tree does not touch the top directory's mtime, so
+    stale previews can persist until the dropped directory itself
+    changes.
+    """
+    config = MergeConfig(
+        include_patterns=list(cfg_key[0]),
+        exclude_patterns=list(cfg_key[1]),
+        recursive=cfg_key[2],
+        max_depth=cfg_key[3],
+        sort_order=cfg_key[4],
+        sort_ascending=cfg_key[5],
+    )
+    return tuple(FileAnalyzer(config).discover_files([Path(path_str)]))
+
+
+class WorkerSignals(QObject):
+    """Signals for pool-based workers (QRunnable cannot own signals)."""
+
     progress = pyqtSignal(MergeProgress)
     finished = pyqtSignal(MergeResult)
     log_message = pyqtSignal(str)
-    
+    files_ready = pyqtSignal(list)
+
+
+class MergeWorker(QRunnable):
+    """Background worker for merge operations.
+
+    Runs on the global QThreadPool rather than a dedicated QThread, so
+    repeated merges reuse pooled threads instead of paying OS thread
+    startup each time.
+    """
+
     def __init__(
         self,
         engine: MergeEngine,
@@ -45,35 +194,113 @@ class MergeWorker(QThread):
         self.files = files
         self.output_path = output_path
         self.dry_run = dry_run
-    
+        self.signals = WorkerSignals()
+        self.setAutoDelete(True)
+
     def run(self):
+        last_emit = 0.0
+        pending_logs: List[str] = []
+
         def on_progress(progress: MergeProgress):
-            self.progress.emit(progress)
-            self.log_message.emit(
+            nonlocal last_emit
+            pending_logs.append(
                 f"Processing {progress.current_file} "
                 f"({progress.current_index}/{progress.total_files})"
             )
-        
+            # Every cross-thread emit queues a QMetaObject invocation on
+            # the GUI thread; cap the rate and batch the log lines so a
+            # merge of thousands of files doesn't flood the event loop.
+            # The final file always flushes so the UI reaches 100%.
+            now = time.monotonic()
+            if (now - last_emit < 0.05
+                    and progress.current_index < progress.total_files):
+                return
+            last_emit = now
+            self.signals.progress.emit(progress)
+            self.signals.log_message.emit('\n'.join(pending_logs))
+            pending_logs.clear()
+
         result = self.engine.merge(
             self.files,
             self.output_path,
             progress_callback=on_progress,
             dry_run=self.dry_run
         )
-        self.finished.emit(result)
+        self.signals.finished.emit(result)
+
+
+class ScanWorker(QRunnable):
+    """Background worker that discovers files for added paths.
+
+    Keeps directory walks and preview reads off the GUI thread; results
+    come back through files_ready for the window to merge in.
+    """
+
+    def __init__(self, paths: List[Path], cfg_key: Tuple, config: MergeConfig):
+        super().__init__()
+        self.paths = paths
+        self.cfg_key = cfg_key
+        self.config = config
+        self.signals = WorkerSignals()
+        self.setAutoDelete(True)
+
+    def run(self):
+        analyzer: Optional[FileAnalyzer] = None
+        found: List[FileInfo] = []
+        try:
+            for path in self.paths:
+                # A failing path (vanished mid-scan, unreadable, …) is
+                # reported and skipped; it must never prevent the
+                # files_ready emit or the window stays in scanning state
+                try:
+                    # Plain markdown files (the common single-file drop)
+                    # bypass the analyzer walk and become FileInfo directly
+                    if path.suffix.lower() in _MARKDOWN_SUFFIXES and path.is_file():
+                        if analyzer is None:
+                            analyzer = FileAnalyzer(self.config)
+                        found.append(analyzer.make_file_info(path))
+                        continue
+                    mtime_ns = path.stat().st_mtime_ns
+                    found.extend(
+                        _scan_path(str(path.resolve()), mtime_ns, self.cfg_key)
+                    )
+                except OSError as e:
+                    self.signals.log_message.emit(f"Could not scan {path}: {e}")
+        finally:
+            self.signals.files_ready.emit(found)
+
+
+class PreviewWorker(QThread):
+    """Background worker that builds the merge preview off the GUI thread."""
+
+    done = pyqtSignal(str)
+
+    def __init__(self, engine: MergeEngine, files: List[FileInfo], max_lines: int = 100):
+        super().__init__()
+        self.engine = engine
+        self.files = files
+        self.max_lines = max_lines
+
+    def run(self):
+        self.done.emit(self.engine.generate_preview(self.files, self.max_lines))
 
 
 class FileListWidget(QListWidget):
     """Custom list widget with drag-and-drop support."""
-    
+
     files_dropped = pyqtSignal(list)
-    
+    # Emitted after an internal drag moves rows, so the owner can resync
+    # any state that mirrors row order
+    rows_reordered = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)
         self.setDragDropMode(QListWidget.DragDropMode.InternalMove)
         self.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
         self.setAlternatingRowColors(True)
+        # All rows are one-line entries, so let Qt skip per-row sizeHint work
+        self.setUniformItemSizes(True)
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
@@ -93,6 +320,7 @@ class FileListWidget(QListWidget):
             event.acceptProposedAction()
         else:
             super().dropEvent(event)
+            self.rows_reordered.emit()
 
 
 class SettingsDialog(QDialog):
@@ -242,6 +470,35 @@ class SettingsDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
     
+    def refresh_from(self, config: MergeConfig):
+        """Re-populate every widget from the given config.
+
+        Lets a cached dialog instance be reopened with current values
+        instead of reconstructing the whole form.
+        """
+        self.config = config
+        self.header_style.setText(config.header_style)
+        self.include_path.setChecked(config.include_file_path)
+        self.include_index.setChecked(config.include_doc_index)
+        self.separator_style.setText(config.separator_style)
+        self.separator_blanks.setValue(config.separator_blank_lines)
+        self.generate_toc.setChecked(config.generate_toc)
+        self.toc_depth.setValue(config.toc_depth)
+        self.toc_style.setCurrentText(config.toc_style)
+        self.toc_position.setCurrentText(config.toc_position)
+        self.adjust_headers.setValue(config.adjust_header_level)
+        self.strip_front_matter.setChecked(config.strip_front_matter)
+        self.normalize_ws.setChecked(config.normalize_whitespace)
+        self.max_blanks.setValue(config.max_consecutive_blanks)
+        self.detect_dupes.setChecked(config.detect_duplicates)
+        self.add_metadata.setChecked(config.add_metadata)
+        self.add_semantic.setChecked(config.add_semantic_markers)
+        self.add_chunks.setChecked(config.add_chunk_hints)
+        self.extract_kw.setChecked(config.extract_keywords)
+        self.encoding.setCurrentText(config.output_encoding)
+        self.line_ending.setCurrentText(config.line_ending)
+        self.create_backup.setChecked(config.create_backup)
+
     def get_config(self) -> MergeConfig:
         """Get updated configuration from dialog."""
         return MergeConfig(
@@ -284,10 +541,54 @@ class MainWindow(QMainWindow):
         
         self.config = get_preset("ai_knowledge_base")
         self.app_config = AppConfig.load()
+        # Snapshot of the config as loaded; closeEvent skips the save
+        # entirely when nothing changed during the session
+        self._loaded_app_config = self.app_config.to_dict()
         self.files: List[FileInfo] = []
+        # Membership set and running size total, maintained incrementally
+        # so adds/removes don't re-traverse the whole file list
+        self._path_set: set = set()
+        self._total_size: int = 0
+        self._last_stats_text: str = ""
+        # Paths currently shown in the list widget, in row order, used to
+        # diff the widget against self.files without a full rebuild
+        self._list_shown_paths: List[Path] = []
+        # Theme currently applied via setStyleSheet; None means neither
+        # theme has been applied yet
+        self._current_theme: Optional[str] = None
         self.worker: Optional[MergeWorker] = None
         self.engine: Optional[MergeEngine] = None
-        
+        self._merge_running = False
+        self._scan_running = False
+        self._settings_dialog: Optional[SettingsDialog] = None
+        self._fd: Optional[QFileDialog] = None
+
+        # Preview rebuilds run on a worker thread; the timer coalesces
+        # rapid refresh requests (F5 spam, quick setting flips)
+        self._preview_worker: Optional[PreviewWorker] = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(150)
+        self._preview_timer.timeout.connect(self._start_preview)
+
+        # Log lines are buffered and flushed as one append; every
+        # QTextEdit.append re-lays-out the document, so bursts of
+        # messages would otherwise pay that per line
+        self._log_buffer: List[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        # Progress signals can arrive faster than the bar is worth
+        # repainting; render at ~10 Hz and always flush the last update
+        self._pending_progress: Optional[MergeProgress] = None
+        self._last_progress_ts = 0.0
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(120)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         self.setup_ui()
         self.setup_menu()
         self.apply_theme()
@@ -338,6 +639,7 @@ class MainWindow(QMainWindow):
         # File list
         self.file_list = FileListWidget()
         self.file_list.files_dropped.connect(self.add_paths)
+        self.file_list.rows_reordered.connect(self._resync_after_reorder)
         self.file_list.itemSelectionChanged.connect(self.on_selection_changed)
         file_layout.addWidget(self.file_list)
         
@@ -357,7 +659,7 @@ class MainWindow(QMainWindow):
         
         self.preview_text = QTextEdit()
         self.preview_text.setReadOnly(True)
-        self.preview_text.setFont(QFont("Consolas", 10))
+        self.preview_text.setFont(_mono_font(10))
         preview_layout.addWidget(self.preview_text)
         
         self.btn_refresh_preview = QPushButton("Refresh Preview")
@@ -388,24 +690,25 @@ class MainWindow(QMainWindow):
         settings_layout.addWidget(QLabel("Separator:"))
         self.separator_combo = QComboBox()
         self.separator_combo.addItems(["---", "***", "___", "None"])
-        self.separator_combo.currentTextChanged.connect(self.on_separator_changed)
+        self._bind_combo(self.separator_combo, 'separator_style',
+                         lambda text: "" if text == "None" else text)
         settings_layout.addWidget(self.separator_combo)
         
         settings_layout.addWidget(QLabel("Header:"))
         self.header_combo = QComboBox()
         self.header_combo.addItems(["# {name}", "## {name}", "### {name}"])
         self.header_combo.setCurrentIndex(1)
-        self.header_combo.currentTextChanged.connect(self.on_header_changed)
+        self._bind_combo(self.header_combo, 'header_style')
         settings_layout.addWidget(self.header_combo)
         
         self.toc_check = QCheckBox("Generate TOC")
         self.toc_check.setChecked(True)
-        self.toc_check.stateChanged.connect(self.on_toc_changed)
+        self._bind_checkbox(self.toc_check, 'generate_toc')
         settings_layout.addWidget(self.toc_check)
         
         self.metadata_check = QCheckBox("Add Metadata")
         self.metadata_check.setChecked(True)
-        self.metadata_check.stateChanged.connect(self.on_metadata_changed)
+        self._bind_checkbox(self.metadata_check, 'add_metadata')
         settings_layout.addWidget(self.metadata_check)
         
         settings_layout.addStretch()
@@ -467,7 +770,10 @@ class MainWindow(QMainWindow):
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(150)
-        self.log_text.setFont(QFont("Consolas", 9))
+        self.log_text.setFont(_mono_font(9))
+        # Cap the log document so long sessions don't accumulate an
+        # unbounded document; Qt drops the oldest blocks automatically
+        self.log_text.document().setMaximumBlockCount(5000)
         log_layout.addWidget(self.log_text)
         
         main_layout.addWidget(log_group)
@@ -546,70 +852,14 @@ class MainWindow(QMainWindow):
     
     def apply_theme(self):
         """Apply current theme."""
+        # setStyleSheet forces Qt to reparse the QSS and invalidate every
+        # widget's style cache, so skip it when the theme is unchanged
+        if self._current_theme == self.app_config.theme:
+            return
+        self._current_theme = self.app_config.theme
+
         if self.app_config.theme == "dark":
-            self.setStyleSheet("""
-                QMainWindow, QDialog {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                QGroupBox {
-                    border: 1px solid #555555;
-                    margin-top: 10px;
-                    padding-top: 10px;
-                    color: #ffffff;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px;
-                }
-                QListWidget, QTextEdit, QLineEdit {
-                    background-color: #1e1e1e;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                }
-                QPushButton {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                    padding: 5px 15px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #4a4a4a;
-                }
-                QPushButton:pressed {
-                    background-color: #2a2a2a;
-                }
-                QComboBox {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                    padding: 3px;
-                }
-                QProgressBar {
-                    border: 1px solid #555555;
-                    background-color: #1e1e1e;
-                    text-align: center;
-                }
-                QProgressBar::chunk {
-                    background-color: #0078d4;
-                }
-                QMenuBar {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                QMenuBar::item:selected {
-                    background-color: #3c3c3c;
-                }
-                QMenu {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                QMenu::item:selected {
-                    background-color: #3c3c3c;
-                }
-            """)
+            self.setStyleSheet(_DARK_QSS)
         else:
             self.setStyleSheet("")
     
@@ -619,101 +869,199 @@ class MainWindow(QMainWindow):
         self.apply_theme()
         self.app_config.save()
     
+    def _file_dialog(self) -> QFileDialog:
+        """Shared file dialog, created lazily and reconfigured per use.
+
+        The static QFileDialog helpers construct (and query system state
+        for) a fresh dialog on every call; reusing one instance keeps
+        later opens fast.
+        """
+        if self._fd is None:
+            self._fd = QFileDialog(self)
+        return self._fd
+
     def add_files(self):
         """Open file dialog to add markdown files."""
-        files, _ = QFileDialog.getOpenFileNames(
-            self,
-            "Select Markdown Files",
-            self.app_config.last_input_dir or "",
-            "Markdown Files (*.md *.markdown);;All Files (*)"
-        )
-        if files:
-            self.app_config.last_input_dir = str(Path(files[0]).parent)
-            self.add_paths([Path(f) for f in files])
-    
+        dialog = self._file_dialog()
+        dialog.setWindowTitle("Select Markdown Files")
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFiles)
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+        dialog.setNameFilter("Markdown Files (*.md *.markdown);;All Files (*)")
+        if self.app_config.last_input_dir:
+            dialog.setDirectory(self.app_config.last_input_dir)
+
+        if dialog.exec():
+            files = dialog.selectedFiles()
+            if files:
+                self.app_config.last_input_dir = str(Path(files[0]).parent)
+                self.add_paths([Path(f) for f in files])
+
     def add_folder(self):
         """Open folder dialog to add markdown files from directory."""
-        folder = QFileDialog.getExistingDirectory(
-            self,
-            "Select Folder",
-            self.app_config.last_input_dir or ""
-        )
-        if folder:
-            self.app_config.last_input_dir = folder
-            self.add_paths([Path(folder)])
+        dialog = self._file_dialog()
+        dialog.setWindowTitle("Select Folder")
+        dialog.setFileMode(QFileDialog.FileMode.Directory)
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+        dialog.setNameFilter("")
+        if self.app_config.last_input_dir:
+            dialog.setDirectory(self.app_config.last_input_dir)
+
+        if dialog.exec():
+            folders = dialog.selectedFiles()
+            if folders:
+                self.app_config.last_input_dir = folders[0]
+                self.add_paths([Path(folders[0])])
     
     def add_paths(self, paths: List[Path]):
-        """Add files from given paths."""
-        analyzer = FileAnalyzer(self.config)
-        
+        """Scan the given paths on the thread pool and add the results."""
+        if self._scan_running:
+            self.log("Scan already in progress; drop ignored")
+            return
+        self._scan_running = True
+        self.btn_add_files.setEnabled(False)
+        self.btn_add_folder.setEnabled(False)
         self.log(f"Scanning {len(paths)} path(s)...")
-        
-        new_files = analyzer.discover_files(
-            paths,
-            progress_callback=lambda msg: self.statusBar().showMessage(msg)
-        )
-        
+
+        worker = ScanWorker(list(paths), _scan_config_key(self.config), self.config)
+        worker.signals.files_ready.connect(self._on_scan_ready)
+        worker.signals.log_message.connect(self.log)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_scan_ready(self, new_files: List[FileInfo]):
+        """Merge scan results into the model (runs on the GUI thread)."""
+        self._scan_running = False
+        self.btn_add_files.setEnabled(True)
+        self.btn_add_folder.setEnabled(True)
+
         # Add to existing files (avoiding duplicates)
-        existing_paths = {f.path for f in self.files}
         for f in new_files:
-            if f.path not in existing_paths:
+            if f.path not in self._path_set:
+                self._path_set.add(f.path)
                 self.files.append(f)
-        
+                self._total_size += f.size
+
         self.update_file_list()
         self.log(f"Added {len(new_files)} file(s). Total: {len(self.files)}")
     
     def update_file_list(self):
-        """Update the file list widget."""
-        self.file_list.clear()
-        
-        for f in self.files:
-            item = QListWidgetItem(f"{f.path.name}  ({f.size_formatted})")
-            item.setData(Qt.ItemDataRole.UserRole, f)
-            item.setToolTip(str(f.path))
-            self.file_list.addItem(item)
-        
-        # Update stats
-        total_size = sum(f.size for f in self.files)
-        self.file_stats.setText(
-            f"Total: {len(self.files)} files, {format_file_size(total_size)}"
-        )
-    
+        """Sync the list widget with self.files and refresh the stats line.
+
+        Rows are diffed against the shown-path mirror, so only the delta
+        is touched instead of clearing and rebuilding the whole widget.
+        Repaints and selection signals are suppressed for the batch so N
+        row changes cost one layout/paint pass instead of N.
+        """
+        shown = self._list_shown_paths
+        self.file_list.setUpdatesEnabled(False)
+        self.file_list.blockSignals(True)
+        try:
+            # Drop rows for files no longer in the model, in reverse so
+            # earlier removals don't shift later indexes
+            for row in range(len(shown) - 1, -1, -1):
+                if shown[row] not in self._path_set:
+                    self.file_list.takeItem(row)
+                    del shown[row]
+
+            # Append rows for files not yet shown
+            if len(shown) != len(self.files):
+                shown_set = set(shown)
+                for f in self.files:
+                    if f.path not in shown_set:
+                        item = QListWidgetItem(f.display_text)
+                        item.setData(_USER_ROLE, f)
+                        item.setToolTip(f.tooltip_text)
+                        self.file_list.addItem(item)
+                        shown.append(f.path)
+        finally:
+            self.file_list.blockSignals(False)
+            self.file_list.setUpdatesEnabled(True)
+            self.file_list.viewport().update()
+
+        self.update_file_stats()
+
+    def _resync_after_reorder(self):
+        """Rebuild self.files and the shown-path mirror from the widget.
+
+        An internal drag moves rows inside the widget only; the model
+        list and the row-indexed mirror must follow the new order or
+        later removals and diffs operate on stale indexes.
+        """
+        widget = self.file_list
+        self.files = [widget.item(i).data(_USER_ROLE)
+                      for i in range(widget.count())]
+        self._list_shown_paths = [f.path for f in self.files]
+
+    def update_file_stats(self):
+        """Refresh the file count / total size label if it changed."""
+        if self.files:
+            text = f"Total: {len(self.files)} files, {format_file_size(self._total_size)}"
+        else:
+            text = "No files selected"
+        # Skip the label repaint when nothing changed
+        if text != self._last_stats_text:
+            self._last_stats_text = text
+            self.file_stats.setText(text)
+
     def clear_files(self):
         """Clear all files from the list."""
         self.files.clear()
+        self._path_set.clear()
+        self._total_size = 0
+        self._list_shown_paths.clear()
         self.file_list.clear()
-        self.file_stats.setText("No files selected")
+        self.update_file_stats()
         self.preview_text.clear()
         self.log("Cleared all files")
-    
+
     def remove_selected(self):
         """Remove selected files from the list."""
         selected = self.file_list.selectedItems()
+        if not selected:
+            return
+
+        # One filtered rebuild instead of a list.remove per item, which
+        # made removing k of n files O(k*n)
+        paths_to_remove = set()
         for item in selected:
-            file_info = item.data(Qt.ItemDataRole.UserRole)
-            if file_info in self.files:
-                self.files.remove(file_info)
-        self.update_file_list()
+            file_info = item.data(_USER_ROLE)
+            paths_to_remove.add(file_info.path)
+            self._total_size -= file_info.size
+        self.files = [f for f in self.files if f.path not in paths_to_remove]
+        self._path_set -= paths_to_remove
+
+        # Take rows in reverse so earlier removals don't shift later indexes
+        for row in sorted((self.file_list.row(item) for item in selected),
+                          reverse=True):
+            self.file_list.takeItem(row)
+            del self._list_shown_paths[row]
+
+        self.update_file_stats()
         self.log(f"Removed {len(selected)} file(s)")
     
     def on_selection_changed(self):
         """Handle file selection change."""
         selected = self.file_list.selectedItems()
         if len(selected) == 1:
-            file_info = selected[0].data(Qt.ItemDataRole.UserRole)
+            file_info = selected[0].data(_USER_ROLE)
             self.preview_text.setPlainText(file_info.preview)
     
     def browse_output(self):
         """Browse for output file location."""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Save Merged File",
-            self.app_config.last_output_dir or "merged.md",
-            "Markdown Files (*.md);;All Files (*)"
-        )
-        if file_path:
-            self.output_path.setText(file_path)
-            self.app_config.last_output_dir = str(Path(file_path).parent)
+        dialog = self._file_dialog()
+        dialog.setWindowTitle("Save Merged File")
+        dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+        dialog.setNameFilter("Markdown Files (*.md);;All Files (*)")
+        dialog.setDefaultSuffix("md")
+        if self.app_config.last_output_dir:
+            dialog.setDirectory(self.app_config.last_output_dir)
+        dialog.selectFile("merged.md")
+
+        if dialog.exec():
+            files = dialog.selectedFiles()
+            if files:
+                self.output_path.setText(files[0])
+                self.app_config.last_output_dir = str(Path(files[0]).parent)
     
     def on_preset_changed(self, preset_name: str):
         """Handle preset selection change."""
@@ -721,25 +1069,26 @@ class MainWindow(QMainWindow):
         self.update_ui_from_config()
         self.log(f"Applied preset: {preset_name}")
     
-    def on_separator_changed(self, separator: str):
-        """Handle separator selection change."""
-        if separator == "None":
-            self.config.separator_style = ""
-        else:
-            self.config.separator_style = separator
-    
-    def on_header_changed(self, header: str):
-        """Handle header style change."""
-        self.config.header_style = header
-    
-    def on_toc_changed(self, state):
-        """Handle TOC checkbox change."""
-        self.config.generate_toc = state == Qt.CheckState.Checked.value
-    
-    def on_metadata_changed(self, state):
-        """Handle metadata checkbox change."""
-        self.config.add_metadata = state == Qt.CheckState.Checked.value
-    
+    def _bind_checkbox(self, checkbox: QCheckBox, attr: str):
+        """Connect a checkbox so toggling it assigns config.<attr>.
+
+        One shared lambda replaces the family of near-identical
+        on_<field>_changed handler methods.
+        """
+        checkbox.stateChanged.connect(
+            lambda state, attr=attr: setattr(
+                self.config, attr, state == _CHECKED_VAL
+            )
+        )
+
+    def _bind_combo(self, combo: QComboBox, attr: str, convert=None):
+        """Connect a combo box so selecting a value assigns config.<attr>."""
+        combo.currentTextChanged.connect(
+            lambda text, attr=attr: setattr(
+                self.config, attr, convert(text) if convert else text
+            )
+        )
+
     def update_ui_from_config(self):
         """Update UI controls from current config."""
         self.toc_check.setChecked(self.config.generate_toc)
@@ -757,21 +1106,57 @@ class MainWindow(QMainWindow):
     
     def show_advanced_settings(self):
         """Show advanced settings dialog."""
-        dialog = SettingsDialog(self.config, self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.config = dialog.get_config()
+        # The dialog holds 20+ widgets; build it once and re-populate on
+        # reopen. This also keeps it in sync after preset changes, which
+        # a freshly-captured config snapshot previously missed.
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self.config, self)
+        else:
+            self._settings_dialog.refresh_from(self.config)
+
+        if self._settings_dialog.exec() == QDialog.DialogCode.Accepted:
+            self.config = self._settings_dialog.get_config()
             self.update_ui_from_config()
             self.log("Settings updated")
     
     def refresh_preview(self):
-        """Refresh the merge preview."""
+        """Request a preview refresh (debounced)."""
+        self._preview_timer.start()
+
+    def _start_preview(self):
+        """Rebuild the preview on a worker thread."""
         if not self.files:
             self.preview_text.setPlainText("No files to preview.")
             return
-        
+
+        key = (
+            self.config.cache_key(),
+            tuple((str(f.path), f.modified, f.size) for f in self.files),
+        )
+        cached = _preview_cache.get(key)
+        if cached is not None:
+            _preview_cache.move_to_end(key)
+            self.preview_text.setPlainText(cached)
+            return
+
+        if self._preview_worker is not None and self._preview_worker.isRunning():
+            # A rebuild is already in flight; try again once it settles
+            self._preview_timer.start()
+            return
+
         engine = MergeEngine(self.config)
-        preview = engine.generate_preview(self.files, max_lines=100)
-        self.preview_text.setPlainText(preview)
+        self._preview_worker = PreviewWorker(engine, list(self.files), max_lines=100)
+        self._preview_worker.done.connect(
+            lambda text, key=key: self._on_preview_ready(key, text)
+        )
+        self._preview_worker.start()
+
+    def _on_preview_ready(self, key, text: str):
+        """Cache and display a freshly built preview."""
+        _preview_cache[key] = text
+        while len(_preview_cache) > _PREVIEW_CACHE_MAX:
+            _preview_cache.popitem(last=False)
+        self.preview_text.setPlainText(text)
     
     def start_merge(self):
         """Start the merge operation."""
@@ -800,9 +1185,9 @@ class MainWindow(QMainWindow):
         # Prepare merge
         self.engine = MergeEngine(self.config)
         self.worker = MergeWorker(self.engine, self.files, output_path)
-        self.worker.progress.connect(self.on_merge_progress)
-        self.worker.finished.connect(self.on_merge_finished)
-        self.worker.log_message.connect(self.log)
+        self.worker.signals.progress.connect(self.on_merge_progress)
+        self.worker.signals.finished.connect(self.on_merge_finished)
+        self.worker.signals.log_message.connect(self.log)
         
         # Update UI
         self.btn_merge.setEnabled(False)
@@ -812,10 +1197,31 @@ class MainWindow(QMainWindow):
         self.status_label.setText("Merging...")
         
         self.log(f"Starting merge of {len(self.files)} files...")
-        self.worker.start()
+        self._merge_running = True
+        QThreadPool.globalInstance().start(self.worker)
     
     def on_merge_progress(self, progress: MergeProgress):
-        """Handle merge progress update."""
+        """Handle merge progress update (rendered at most ~10 Hz)."""
+        self._pending_progress = progress
+        now = time.monotonic()
+        if now - self._last_progress_ts < 0.1:
+            # Too soon to repaint; the timer guarantees the update still
+            # lands even if no further signal arrives
+            if not self._progress_timer.isActive():
+                self._progress_timer.start()
+            return
+        self._last_progress_ts = now
+        self._render_progress()
+
+    def _flush_progress(self):
+        """Render a deferred progress update."""
+        if self._pending_progress is not None:
+            self._last_progress_ts = time.monotonic()
+            self._render_progress()
+
+    def _render_progress(self):
+        progress = self._pending_progress
+        self._pending_progress = None
         self.progress_bar.setValue(int(progress.percent))
         self.status_label.setText(
             f"Processing: {progress.current_file} "
@@ -824,6 +1230,7 @@ class MainWindow(QMainWindow):
     
     def on_merge_finished(self, result: MergeResult):
         """Handle merge completion."""
+        self._merge_running = False
         self.btn_merge.setEnabled(True)
         self.btn_pause.setEnabled(False)
         self.btn_cancel.setEnabled(False)
@@ -917,9 +1324,29 @@ class MainWindow(QMainWindow):
                 )
     
     def log(self, message: str):
-        """Add message to log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        """Queue a message for the log pane (flushed in batches)."""
+        timestamp = _log_timestamp(int(time.time()))
+        self._log_buffer.append(f"[{timestamp}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append the buffered log lines in a single document edit."""
+        if not self._log_buffer:
+            return
+        text = '\n'.join(self._log_buffer)
+        self._log_buffer.clear()
+        # One reflow and one repaint per flush: suppress updates, insert
+        # the batch as plain text at the end, then scroll once
+        self.log_text.setUpdatesEnabled(False)
+        try:
+            cursor = self.log_text.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            if not cursor.atStart():
+                cursor.insertText('\n')
+            cursor.insertText(text)
+        finally:
+            self.log_text.setUpdatesEnabled(True)
         # Scroll to bottom
         self.log_text.verticalScrollBar().setValue(
             self.log_text.verticalScrollBar().maximum()
@@ -947,13 +1374,15 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle window close."""
-        # Save window size
+        # Save window size, but touch disk only if anything changed
+        # since the config was loaded
         self.app_config.window_width = self.width()
         self.app_config.window_height = self.height()
-        self.app_config.save()
+        if self.app_config.to_dict() != self._loaded_app_config:
+            self.app_config.save()
         
         # Cancel any running merge
-        if self.worker and self.worker.isRunning():
+        if self._merge_running:
             reply = QMessageBox.question(
                 self,
                 "Confirm Exit",
@@ -964,7 +1393,7 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
             self.engine.cancel()
-            self.worker.wait(2000)
+            QThreadPool.globalInstance().waitForDone(2000)
         
         event.accept()
 
@@ -7,13 +7,17 @@ from .helpers import (
     format_file_size,
     format_duration,
     calculate_file_hash,
+    hash_files_parallel,
     matches_patterns,
     extract_front_matter,
     adjust_header_levels,
     normalize_line_endings,
     normalize_whitespace,
     extract_headers,
+    fused_transform,
+    head_lines,
     generate_anchor,
+    is_pure_passthrough,
     detect_encoding,
     safe_read_file,
     extract_keywords,
@@ -30,13 +34,17 @@ __all__ = [
     'format_file_size',
     'format_duration',
     'calculate_file_hash',
+    'hash_files_parallel',
     'matches_patterns',
     'extract_front_matter',
     'adjust_header_levels',
     'normalize_line_endings',
     'normalize_whitespace',
     'extract_headers',
+    'fused_transform',
+    'head_lines',
     'generate_anchor',
+    'is_pure_passthrough',
     'detect_encoding',
     'safe_read_file',
     'extract_keywords',
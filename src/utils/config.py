@@ -5,12 +5,62 @@ Provides centralized configuration handling with validation.
 
 import json
 import os
-from dataclasses import dataclass, field, asdict
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field, asdict, replace
+from typing import ClassVar, Optional, List, Dict, Any
 from pathlib import Path
 
+# Configs are small, but loads/saves happen at startup, close, and every
+# project add; use orjson when installed and fall back to stdlib json.
+try:
+    import orjson
 
-@dataclass
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+    _loads = json.loads
+
+
+# (payload hash, file mtime) per config path as of our last write.
+# save() is called on window resize/close and after every project add,
+# usually with nothing changed; comparing against this skips the
+# redundant disk write.
+_saved_payload_state: Dict[str, tuple] = {}
+
+
+def _write_config_file(filepath: Path, data: Dict[str, Any]) -> None:
+    """
+    Serialize a config dict to disk, skipping unchanged payloads.
+
+    The skip only applies while the file still matches our last write
+    (same mtime), so a config deleted or edited externally mid-session
+    is rewritten rather than silently dropped. Writes go through a temp
+    file and os.replace so an interrupted save never leaves a truncated
+    config behind.
+    """
+    text = _dumps(data)
+    key = str(filepath)
+    payload_hash = hash(text)
+    state = _saved_payload_state.get(key)
+    if state is not None and state[0] == payload_hash:
+        try:
+            if os.stat(filepath).st_mtime_ns == state[1]:
+                return
+        except OSError:
+            pass
+
+    tmp_path = filepath.with_name(filepath.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, filepath)
+    _saved_payload_state[key] = (payload_hash, os.stat(filepath).st_mtime_ns)
+
+
+@dataclass(slots=True)
 class MergeConfig:
     """Configuration for merge operations."""
     
@@ -59,28 +109,57 @@ class MergeConfig:
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
         return asdict(self)
-    
+
+    def cache_key(self) -> tuple:
+        """Hashable snapshot of all fields, usable as a cache key."""
+        return tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (getattr(self, name) for name in self.__dataclass_fields__)
+        )
+
+    def parse_cache_key(self) -> tuple:
+        """
+        Hashable snapshot of only the fields that affect per-document
+        parsing, for memoizing transform results.
+        """
+        return (
+            self.strip_front_matter,
+            self.adjust_header_level,
+            self.normalize_whitespace,
+            self.max_consecutive_blanks,
+            self.line_ending,
+            self.toc_depth,
+            self.extract_keywords,
+            self.generate_toc,
+            self.fix_relative_links,
+        )
+
+    # Field-name set shared by all from_dict calls; the dataclass
+    # metadata never changes after class creation
+    _VALID_FIELDS: ClassVar[frozenset] = frozenset()
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MergeConfig":
         """Create config from dictionary."""
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
+        valid_fields = cls._VALID_FIELDS
+        if not valid_fields:
+            valid_fields = cls._VALID_FIELDS = frozenset(cls.__dataclass_fields__)
         filtered_data = {k: v for k, v in data.items() if k in valid_fields}
         return cls(**filtered_data)
-    
+
     def save(self, filepath: Path) -> None:
         """Save configuration to JSON file."""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        _write_config_file(filepath, self.to_dict())
     
     @classmethod
     def load(cls, filepath: Path) -> "MergeConfig":
         """Load configuration from JSON file."""
         with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = _loads(f.read())
         return cls.from_dict(data)
 
 
-@dataclass  
+@dataclass(slots=True)
 class AppConfig:
     """Application-level configuration."""
     
@@ -99,10 +178,15 @@ class AppConfig:
         """Convert config to dictionary."""
         return asdict(self)
     
+    # Field-name set shared by all from_dict calls, mirroring MergeConfig
+    _VALID_FIELDS: ClassVar[frozenset] = frozenset()
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AppConfig":
         """Create config from dictionary."""
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
+        valid_fields = cls._VALID_FIELDS
+        if not valid_fields:
+            valid_fields = cls._VALID_FIELDS = frozenset(cls.__dataclass_fields__)
         filtered_data = {k: v for k, v in data.items() if k in valid_fields}
         return cls(**filtered_data)
     
@@ -127,8 +211,7 @@ class AppConfig:
         """Save app configuration."""
         if filepath is None:
             filepath = self.get_config_dir() / 'app_config.json'
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        _write_config_file(filepath, self.to_dict())
     
     @classmethod
     def load(cls, filepath: Optional[Path] = None) -> "AppConfig":
@@ -139,9 +222,10 @@ class AppConfig:
             return cls()
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = _loads(f.read())
             return cls.from_dict(data)
-        except (json.JSONDecodeError, IOError):
+        # Both stdlib and orjson decode errors subclass ValueError
+        except (ValueError, IOError):
             return cls()
 
 
@@ -192,5 +276,11 @@ def get_preset(name: str) -> MergeConfig:
     """Get a preset configuration by name."""
     if name not in PRESETS:
         raise ValueError(f"Unknown preset: {name}. Available: {list(PRESETS.keys())}")
-    # Return a copy to avoid modifying the original
-    return MergeConfig.from_dict(PRESETS[name].to_dict())
+    preset = PRESETS[name]
+    # Shallow field copy instead of a dict roundtrip; the list fields get
+    # fresh copies so callers can't mutate the shared preset through them
+    return replace(
+        preset,
+        include_patterns=list(preset.include_patterns),
+        exclude_patterns=list(preset.exclude_patterns),
+    )
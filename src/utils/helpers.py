@@ -2,20 +2,50 @@
 Utility helper functions for Markdown Merger application.
 """
 
+import os
 import re
 import hashlib
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Optional
-from fnmatch import fnmatch
+from fnmatch import translate as _fnmatch_translate
 
+# Duplicate detection doesn't need a cryptographic hash, so prefer xxHash
+# (runs at memory bandwidth) when available and fall back to MD5 otherwise.
+try:
+    import xxhash
+    _new_file_hasher = xxhash.xxh3_128
+except ImportError:
+    _new_file_hasher = hashlib.md5
 
-def natural_sort_key(s: str) -> List:
+# Compiled once at import; these run per file (or per header) on every
+# merge, and passing string literals to re.* re-checks the pattern cache
+# on each call.
+_NUMBER_RE = re.compile(r'(\d+)')
+_HEADER_LINE_RE = re.compile(r'^(#{1,6})(\s+.*)$', re.MULTILINE)
+_HEADER_TEXT_RE = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+_ANCHOR_SPECIALS_RE = re.compile(r'[^\w\s-]+')
+_WS_RUN_RE = re.compile(r'\s+')
+# Deletion table covering every ASCII char _ANCHOR_SPECIALS_RE would
+# drop; built from the pattern itself so the two stay in agreement
+_ANCHOR_TRANS = {c: None for c in range(128) if not re.match(r'[\w\s-]', chr(c))}
+_EMPHASIS_RE = re.compile(r'\*\*([^*]+)\*\*|\*([^*]+)\*|__([^_]+)__|_([^_]+)_')
+_TITLE_WORDS_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+
+
+@lru_cache(maxsize=8192)
+def natural_sort_key(s: str) -> tuple:
     """
     Generate a key for natural sorting.
     Handles numbers within strings properly (file1, file2, file10).
+
+    Keys repeat across re-sorts of the same file list, so they are
+    memoized; tuples compare the same way the old lists did.
     """
-    return [int(text) if text.isdigit() else text.lower() 
-            for text in re.split(r'(\d+)', str(s))]
+    return tuple(int(text) if text.isdigit() else text.lower()
+                 for text in _NUMBER_RE.split(str(s)))
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -41,46 +71,85 @@ def format_duration(seconds: float) -> str:
         return f"{hours}h {minutes}m"
 
 
-def calculate_file_hash(filepath: Path, chunk_size: int = 8192) -> str:
-    """Calculate MD5 hash of file content for duplicate detection."""
-    hasher = hashlib.md5()
+def calculate_file_hash(filepath: Path, chunk_size: int = 1 << 20) -> str:
+    """Calculate content hash of a file for duplicate detection."""
     with open(filepath, 'rb') as f:
-        while chunk := f.read(chunk_size):
-            hasher.update(chunk)
+        try:
+            # Feed the mapped file to the hasher in one call; its C loop
+            # walks the pages directly with no per-chunk allocations.
+            hasher = _new_file_hasher()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+        except (ValueError, OSError):
+            # Empty or unmappable files fall back to file_digest, which
+            # streams through one reused buffer instead of allocating a
+            # fresh bytes object per chunk
+            hasher = hashlib.file_digest(f, _new_file_hasher)
     return hasher.hexdigest()
 
 
+def hash_files_parallel(
+    paths: List[Path],
+    workers: Optional[int] = None,
+) -> List[str]:
+    """
+    Hash many files on a thread pool, preserving input order.
+
+    Both the file reads and the hash cores release the GIL, so threads
+    overlap per-file I/O without process-pool pickling costs.
+    """
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(calculate_file_hash, paths, chunksize=16))
+
+
+@lru_cache(maxsize=128)
+def _pattern_alternation(patterns: Tuple[str, ...]):
+    """One compiled regex matching any of the lowercased glob patterns."""
+    return re.compile('|'.join(_fnmatch_translate(p.lower()) for p in patterns))
+
+
 def matches_patterns(filename: str, patterns: List[str]) -> bool:
     """Check if filename matches any of the glob patterns."""
-    return any(fnmatch(filename.lower(), pattern.lower()) for pattern in patterns)
+    # The pattern lists come from config and repeat across thousands of
+    # files, so compile them once into a single alternation
+    if not patterns:
+        return False
+    return _pattern_alternation(tuple(patterns)).match(filename.lower()) is not None
 
 
 def extract_front_matter(content: str) -> Tuple[Optional[str], str]:
     """
     Extract YAML front matter from markdown content.
-    
+
     Returns:
         Tuple of (front_matter, content_without_front_matter)
     """
     if not content.startswith('---'):
         return None, content
-    
-    # Find closing ---
-    lines = content.split('\n')
-    end_index = None
-    
-    for i, line in enumerate(lines[1:], 1):
-        if line.strip() == '---':
-            end_index = i
-            break
-    
-    if end_index is None:
+
+    # Walk line starts in place with str.find instead of materializing
+    # the whole document as a line list and re-joining the two halves
+    first_nl = content.find('\n')
+    if first_nl == -1:
         return None, content
-    
-    front_matter = '\n'.join(lines[1:end_index])
-    remaining_content = '\n'.join(lines[end_index + 1:]).lstrip('\n')
-    
-    return front_matter, remaining_content
+
+    start = first_nl + 1
+    line_start = start
+    while True:
+        line_end = content.find('\n', line_start)
+        line = content[line_start:] if line_end == -1 else content[line_start:line_end]
+
+        if line.strip() == '---':
+            front_matter = content[start:line_start - 1] if line_start > start else ''
+            if line_end == -1:
+                return front_matter, ''
+            return front_matter, content[line_end + 1:].lstrip('\n')
+
+        if line_end == -1:
+            return None, content
+        line_start = line_end + 1
 
 
 def adjust_header_levels(content: str, offset: int) -> str:
@@ -101,36 +170,46 @@ def adjust_header_levels(content: str, offset: int) -> str:
         current_level = len(match.group(1))
         new_level = max(1, min(6, current_level + offset))
         return '#' * new_level + match.group(2)
-    
+
     # Match headers at start of line: # Header text
-    pattern = r'^(#{1,6})(\s+.*)$'
-    return re.sub(pattern, adjust_header, content, flags=re.MULTILINE)
+    return _HEADER_LINE_RE.sub(adjust_header, content)
 
 
 def normalize_line_endings(content: str, style: str = "lf") -> str:
     """Normalize line endings to specified style."""
-    # First normalize to LF
-    content = content.replace('\r\n', '\n').replace('\r', '\n')
-    
+    # Fast path: content with no \r (the common case for LF input) needs
+    # no normalization pass at all
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+
     if style.lower() == "crlf":
         content = content.replace('\n', '\r\n')
-    
+
     return content
 
 
+@lru_cache(maxsize=16)
+def _blank_run_pattern(max_consecutive: int):
+    """Compiled blank-run pattern and replacement for a given maximum."""
+    return (
+        re.compile(r'\n{' + str(max_consecutive + 2) + r',}'),
+        '\n' * (max_consecutive + 1),
+    )
+
+
 def normalize_whitespace(content: str, max_consecutive: int = 2) -> str:
     """
     Normalize consecutive blank lines.
-    
+
     Args:
         content: Content to normalize
         max_consecutive: Maximum consecutive blank lines to keep
     """
-    # Replace multiple blank lines with specified maximum
-    pattern = r'\n{' + str(max_consecutive + 2) + r',}'
-    replacement = '\n' * (max_consecutive + 1)
-    
-    return re.sub(pattern, replacement, content).strip() + '\n'
+    # Replace multiple blank lines with specified maximum; the pattern
+    # depends on max_consecutive, so it's compiled once per value
+    pattern, replacement = _blank_run_pattern(max_consecutive)
+
+    return pattern.sub(replacement, content).strip() + '\n'
 
 
 def extract_headers(content: str, max_depth: int = 6) -> List[Tuple[int, str]]:
@@ -141,63 +220,192 @@ def extract_headers(content: str, max_depth: int = 6) -> List[Tuple[int, str]]:
         List of (level, header_text) tuples
     """
     headers = []
-    pattern = r'^(#{1,6})\s+(.+)$'
-    
-    for match in re.finditer(pattern, content, re.MULTILINE):
+
+    for match in _HEADER_TEXT_RE.finditer(content):
         level = len(match.group(1))
         if level <= max_depth:
             headers.append((level, match.group(2).strip()))
-    
+
     return headers
 
 
+def head_lines(text: str, count: int) -> List[str]:
+    """
+    Return the first `count` lines of text.
+    Scans only as far as needed instead of splitting the whole string.
+    """
+    if count <= 0:
+        return []
+
+    lines = []
+    start = 0
+    while len(lines) < count:
+        end = text.find('\n', start)
+        if end == -1:
+            lines.append(text[start:])
+            break
+        lines.append(text[start:end])
+        start = end + 1
+
+    return lines
+
+
 def generate_anchor(text: str) -> str:
     """Generate a URL-safe anchor from header text."""
-    # Remove special characters, convert to lowercase
-    anchor = re.sub(r'[^\w\s-]', '', text.lower())
-    anchor = re.sub(r'[\s]+', '-', anchor)
-    return anchor
+    text = text.lower()
+    # Specials are dropped first, then the resulting whitespace runs are
+    # collapsed, so "setup & install" yields one hyphen, not two. ASCII
+    # header text (the overwhelming majority) does the first phase with
+    # a C-level translate table instead of the regex.
+    if text.isascii():
+        return _WS_RUN_RE.sub('-', text.translate(_ANCHOR_TRANS))
+    return _WS_RUN_RE.sub('-', _ANCHOR_SPECIALS_RE.sub('', text))
 
 
-def detect_encoding(filepath: Path) -> str:
-    """Detect file encoding using chardet if available."""
+def _detect_encoding_from_bytes(raw_data: bytes) -> str:
+    """Pick a decode encoding for raw bytes using chardet if available."""
     try:
         import chardet
-        with open(filepath, 'rb') as f:
-            raw_data = f.read(10000)  # Read first 10KB
-        result = chardet.detect(raw_data)
-        detected = result.get('encoding', 'utf-8') or 'utf-8'
-        confidence = result.get('confidence', 0)
-        
-        # Prefer UTF-8 if confidence is low or if detected encoding is ASCII-compatible
-        if confidence < 0.8 or detected.lower() in ('ascii', 'iso-8859-1', 'windows-1252'):
-            return 'utf-8'
-        return detected
     except ImportError:
         return 'utf-8'
 
+    result = chardet.detect(raw_data[:10000])  # First 10KB is plenty
+    detected = result.get('encoding', 'utf-8') or 'utf-8'
+    confidence = result.get('confidence', 0)
+
+    # Prefer UTF-8 if confidence is low or if detected encoding is ASCII-compatible
+    if confidence < 0.8 or detected.lower() in ('ascii', 'iso-8859-1', 'windows-1252'):
+        return 'utf-8'
+    return detected
+
+
+def detect_encoding(filepath: Path) -> str:
+    """Detect file encoding using chardet if available."""
+    with open(filepath, 'rb') as f:
+        raw_data = f.read(10000)  # Read first 10KB
+    return _detect_encoding_from_bytes(raw_data)
+
 
 def safe_read_file(filepath: Path, fallback_encoding: str = 'utf-8') -> str:
     """
     Safely read a file with encoding detection and fallback.
+
+    The raw bytes are read once and each decode attempt runs in memory,
+    instead of reopening and rereading the file per encoding.
     """
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+
     # Try UTF-8 first (most common for markdown files)
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
+        return raw.decode('utf-8')
     except UnicodeDecodeError:
         pass
-    
+
     # Try detected encoding
-    encoding = detect_encoding(filepath)
-    
+    encoding = _detect_encoding_from_bytes(raw)
+
     try:
-        with open(filepath, 'r', encoding=encoding) as f:
-            return f.read()
+        return raw.decode(encoding)
     except UnicodeDecodeError:
-        # Last resort: read with errors replaced
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-            return f.read()
+        # Last resort: decode with errors replaced
+        return raw.decode('utf-8', errors='replace')
+
+
+def is_pure_passthrough(config) -> bool:
+    """
+    True when the merge config applies no content transformations.
+
+    Such documents go into the output verbatim, so callers can skip the
+    per-document transform pass entirely.
+    """
+    return (
+        config.adjust_header_level == 0
+        and not config.fix_relative_links
+        and not config.strip_front_matter
+        and not config.normalize_whitespace
+        and config.line_ending == 'lf'
+    )
+
+
+def fused_transform(
+    content: str,
+    *,
+    strip_front_matter: bool = False,
+    header_offset: int = 0,
+    normalize_blanks: bool = False,
+    max_consecutive_blanks: int = 2,
+    line_ending: str = "lf",
+    max_header_depth: int = 6,
+) -> Tuple[str, List[Tuple[int, str]], Optional[str]]:
+    """
+    Apply the per-document transformations in a single pass.
+
+    Combines front-matter stripping, header-level adjustment, blank-line
+    normalization, line-ending normalization, and header extraction into
+    one walk over the content instead of five separate scans.
+
+    Returns:
+        Tuple of (processed_content, headers, front_matter)
+    """
+    # Normalize to LF up front; the line walk below assumes plain \n
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+    lines = content.split('\n')
+    front_matter = None
+    start = 0
+
+    if strip_front_matter and content.startswith('---'):
+        for i in range(1, len(lines)):
+            if lines[i].strip() == '---':
+                front_matter = '\n'.join(lines[1:i])
+                start = i + 1
+                # Matches the lstrip('\n') after front-matter removal
+                while start < len(lines) and lines[start] == '':
+                    start += 1
+                break
+
+    out: List[str] = []
+    headers: List[Tuple[int, str]] = []
+    blank_run = 0
+
+    for i in range(start, len(lines)):
+        line = lines[i]
+
+        if line == '':
+            blank_run += 1
+            # A run of N blank lines may keep at most max_consecutive_blanks
+            if normalize_blanks and blank_run > max_consecutive_blanks:
+                continue
+            out.append(line)
+            continue
+        blank_run = 0
+
+        if line[0] == '#':
+            hashes = 1
+            length = len(line)
+            while hashes < length and line[hashes] == '#':
+                hashes += 1
+            # A header is 1-6 hashes followed by whitespace
+            if hashes <= 6 and hashes < length and line[hashes].isspace():
+                level = hashes
+                if header_offset:
+                    level = max(1, min(6, hashes + header_offset))
+                    line = '#' * level + line[hashes:]
+                text = line[level:].strip()
+                if text and level <= max_header_depth:
+                    headers.append((level, text))
+
+        out.append(line)
+
+    result = '\n'.join(out)
+    if normalize_blanks:
+        result = result.strip() + '\n'
+    if line_ending.lower() == 'crlf':
+        result = result.replace('\n', '\r\n')
+
+    return result, headers, front_matter
 
 
 def extract_keywords(content: str, max_keywords: int = 10) -> List[str]:
@@ -206,21 +414,20 @@ def extract_keywords(content: str, max_keywords: int = 10) -> List[str]:
     Simple extraction based on header text and emphasized words.
     """
     keywords = set()
-    
-    # Extract from headers
-    headers = extract_headers(content)
-    for _, text in headers:
+
+    # The header and emphasis scans stay independent: emphasis spans may
+    # legitimately cross lines, so fusing the two patterns would let a
+    # stray * or _ before a header swallow the header line
+    for _, text in extract_headers(content):
         # Add significant words from headers
-        words = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', text)
-        keywords.update(words)
-    
+        keywords.update(_TITLE_WORDS_RE.findall(text))
+
     # Extract emphasized text (bold, italic)
-    emphasized = re.findall(r'\*\*([^*]+)\*\*|\*([^*]+)\*|__([^_]+)__|_([^_]+)_', content)
-    for groups in emphasized:
+    for groups in _EMPHASIS_RE.findall(content):
         for text in groups:
             if text and len(text) > 3:
                 keywords.add(text.strip())
-    
+
     # Filter and limit
     filtered = [k for k in keywords if len(k) > 2 and not k.isdigit()]
     return sorted(filtered)[:max_keywords]
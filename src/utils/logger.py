@@ -4,17 +4,23 @@ Logging configuration for Markdown Merger application.
 
 import logging
 import os
+import time
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
 from typing import Optional
 
 
+@lru_cache(maxsize=2)
+def _format_timestamp(second: int) -> str:
+    """HH:MM:SS for a whole second; bursts of records share the string."""
+    return time.strftime('%H:%M:%S', time.localtime(second))
+
+
 class LogFormatter(logging.Formatter):
     """Custom formatter with timestamp and level."""
-    
+
     def format(self, record):
-        timestamp = datetime.fromtimestamp(record.created).strftime('%H:%M:%S')
-        return f"[{timestamp}] {record.getMessage()}"
+        return f"[{_format_timestamp(int(record.created))}] {record.getMessage()}"
 
 
 def setup_logging(
@@ -1,8 +1,18 @@
 """Pytest configuration and fixtures."""
 
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Add src to Python path
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path.parent))
+
+# Route test temp dirs to tmpfs when the host has one. The integration
+# tests write hundreds of small files per run; RAM-backed storage keeps
+# that out of real disk time while the code under test still sees
+# ordinary filesystem paths (mmap included).
+_shm = Path("/dev/shm")
+if _shm.is_dir() and os.access(_shm, os.W_OK):
+    tempfile.tempdir = str(_shm)
@@ -90,72 +90,47 @@ def example_{i}():
 
 class TestPresets:
     """Test preset configurations."""
-    
+
     @pytest.fixture
     def temp_dir(self):
-        """Create a temporary directory with test files."""
+        """Create a temporary directory with test files.
+
+        Sources live in a subdirectory so a preset's output is never
+        picked up as input.
+        """
         with tempfile.TemporaryDirectory() as tmpdir:
             tmpdir = Path(tmpdir)
-            
-            (tmpdir / "test1.md").write_text("# Test 1\n\nContent.\n")
-            (tmpdir / "test2.md").write_text("# Test 2\n\nMore content.\n")
-            
+            docs = tmpdir / "docs"
+            docs.mkdir()
+
+            (docs / "test1.md").write_text("# Test 1\n\nContent.\n")
+            (docs / "test2.md").write_text("# Test 2\n\nMore content.\n")
+
             yield tmpdir
-    
-    def test_basic_preset(self, temp_dir):
-        """Test basic preset merges without extras."""
-        config = get_preset("basic")
-        
-        analyzer = FileAnalyzer(config)
-        files = analyzer.discover_files([temp_dir])
-        
-        output_path = temp_dir / "output.md"
-        engine = MergeEngine(config)
-        result = engine.merge(files, output_path)
-        
-        assert result.success
-        content = output_path.read_text()
-        
-        # Basic preset should NOT have TOC or metadata
-        assert "# Table of Contents" not in content
-        assert "DOC_META" not in content
-    
-    def test_ai_knowledge_base_preset(self, temp_dir):
-        """Test AI knowledge base preset has all features."""
-        config = get_preset("ai_knowledge_base")
-        
-        analyzer = FileAnalyzer(config)
-        files = analyzer.discover_files([temp_dir])
-        
-        output_path = temp_dir / "output.md"
-        engine = MergeEngine(config)
-        result = engine.merge(files, output_path)
-        
-        assert result.success
-        content = output_path.read_text()
-        
-        # AI preset should have all features
-        assert "# Table of Contents" in content
-        assert "DOC_META" in content
-        assert "<document" in content
-    
-    def test_documentation_preset(self, temp_dir):
-        """Test documentation preset."""
-        config = get_preset("documentation")
-        
+
+    @pytest.mark.parametrize("preset,expect_toc,expect_meta,expect_semantic", [
+        ("basic", False, False, False),
+        ("ai_knowledge_base", True, True, True),
+        ("documentation", True, False, False),
+    ])
+    def test_preset_features(self, temp_dir, preset, expect_toc,
+                             expect_meta, expect_semantic):
+        """Each preset produces exactly the features it advertises."""
+        config = get_preset(preset)
+
         analyzer = FileAnalyzer(config)
-        files = analyzer.discover_files([temp_dir])
-        
-        output_path = temp_dir / "output.md"
+        files = analyzer.discover_files([temp_dir / "docs"])
+
+        output_path = temp_dir / f"output_{preset}.md"
         engine = MergeEngine(config)
         result = engine.merge(files, output_path)
-        
+
         assert result.success
         content = output_path.read_text()
-        
-        # Documentation preset should have TOC but no metadata
-        assert "# Table of Contents" in content
-        assert "DOC_META" not in content
+
+        assert ("# Table of Contents" in content) == expect_toc
+        assert ("DOC_META" in content) == expect_meta
+        assert ("<document" in content) == expect_semantic
 
 
 class TestEdgeCases: